@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import functools
+import os
 import subprocess
+import sys
 import threading
 import random
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List
 from pathlib import Path
 
+import numpy as np
 import psutil
 from PyQt6 import QtCore
 
@@ -18,7 +24,7 @@ from .core.tts_service import TTSService
 from .core.logger import setup_logging
 from .core.timeline import TimelineManager
 from .core.audio_manager import AudioManager
-from .core.stt_service import STTService
+from .core.stt_service import STTService, pick_device
 from .core.identity import IdentityManager
 from .core.memory import MemoryManager, MemoryItem
 from .core.camera_monitor import CameraMonitor
@@ -27,6 +33,100 @@ from .core.workflow_engine import WorkflowEngine
 from .core.personality import PersonalityProfile
 
 
+# Resolved once at import: Path.resolve() walks every path component
+# with stat() calls, which there is no reason to repeat per controller.
+_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+# Launch commands for each logical app (open path). Built once at
+# module load instead of per call; tuples so the table is immutable.
+_APP_MAP = {
+    "notepad": ("notepad.exe",),
+    "chrome": ("chrome.exe",),
+    "edge": ("msedge.exe",),
+    "code": ("code.exe",),
+    # Update this path for your machine if needed:
+    "whatsapp": (r"whatsapp.exe",),
+}
+
+# Process image names for each logical app (close path). Built once at
+# module load; the lower-cased frozensets make the POSIX fallback's
+# per-process membership test a single hash probe with no allocation.
+_PROC_MAP = {
+    "notepad": ("notepad.exe",),
+    "chrome": ("chrome.exe",),
+    "edge": ("chrome.exe", "msedge.exe"),
+    "code": ("Code.exe", "code.exe"),
+    "whatsapp": ("whatsapp.exe",),
+}
+_PROC_TARGETS_LOWER = {
+    k: frozenset(t.lower() for t in v) for k, v in _PROC_MAP.items()
+}
+
+# Apps that only ever run one process: the close scan can stop at the
+# first hit instead of walking the rest of the process table. Chrome,
+# Edge and Code are multi-process, so they stay out of this set.
+_SINGLE_INSTANCE = frozenset({"notepad", "whatsapp"})
+
+# Exact-phrase commands handled ahead of CommandEngine: every accepted
+# phrasing maps to a _cmd_* handler suffix. Bound to methods once per
+# controller in __init__, so _process_command resolves all of these
+# with a single dict probe instead of a chain of membership tests.
+_EXACT_CMDS = {
+    "focus mode": "focus_mode",
+    "start focus mode": "focus_mode",
+    "enter focus mode": "focus_mode",
+    "open notepad": "open_notepad",
+    "open note pad": "open_notepad",
+    "open the notepad": "open_notepad",
+    "notepad": "open_notepad",
+    "note pad": "open_notepad",
+    "close notepad": "close_notepad",
+    "close note pad": "close_notepad",
+    "close the notepad": "close_notepad",
+    "close that": "close_last",
+    "close it": "close_last",
+    "close this": "close_last",
+    "forget that": "forget_last",
+    "forget it": "forget_last",
+    "delete that note": "forget_last",
+    "remove that note": "forget_last",
+    "forget last note": "forget_last",
+    "normal mode": "normal_mode",
+    "return to normal mode": "normal_mode",
+    "stand down": "normal_mode",
+    "vortex": "text_wake",
+    "hey vortex": "text_wake",
+    "list workflows": "list_workflows",
+    "show workflows": "list_workflows",
+    "what workflows do you have": "list_workflows",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _make_stt(
+    model_size: str,
+    device: str,
+    compute_type: str,
+    cpu_threads: int,
+    num_workers: int = 1,
+) -> STTService:
+    """
+    Process-wide STTService cache keyed on its construction parameters.
+
+    Loading the Whisper model is by far the slowest init step; with the
+    cache, a second controller (dev reloads, tests) reuses the already
+    loaded model instead of paying the load again. STTService is
+    stateless after construction, so sharing is safe.
+    """
+    return STTService(
+        model_size=model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=cpu_threads,
+        num_workers=num_workers,
+    )
+
+
 class VortexController(QtCore.QObject):
     """
     Main orchestrator for VORTEX:
@@ -36,11 +136,14 @@ class VortexController(QtCore.QObject):
     # Signals into UI
     system_message = QtCore.pyqtSignal(str)
     user_message = QtCore.pyqtSignal(str)
-    timeline_entry = QtCore.pyqtSignal(str)
+    timeline_batch = QtCore.pyqtSignal(list)
     memory_snapshot = QtCore.pyqtSignal(str)
 
+    # Internal: marshals "start the flush timer" onto the GUI thread,
+    # since _add_timeline runs on worker threads too.
+    _timeline_kick = QtCore.pyqtSignal()
+
     # Voice pipeline
-    voice_command_ready = QtCore.pyqtSignal(str)
     wake_word_detected = QtCore.pyqtSignal()
 
     # UI-change signals (to avoid touching widgets from worker threads)
@@ -53,13 +156,56 @@ class VortexController(QtCore.QObject):
         self.owner_name = owner_name
 
         # ---- Runtime state ----
+        # Set before anything that may speak: _emit_system_message touches
+        # wake_listener, and the greeting fires before the Porcupine setup
+        # below. Without this the early calls only "worked" by catching
+        # AttributeError in their try/except blocks.
+        self.wake_listener: Optional[WakeWordListener] = None
         self.use_face_fallback: bool = False
         self._last_app_opened: Optional[str] = None
         self._last_memory_results: List[MemoryItem] = []
-        self._recording_lock = threading.Lock()
+        # "Recording in flight" flag; _recording_tas only guards the
+        # test-and-set, never the recording itself.
+        self._recording = False
+        self._recording_tas = threading.Lock()
         self._friend_mode_running: bool = True
-        self._friend_thread: Optional[threading.Thread] = None
         self.camera_locked: bool = False
+        # Last theme/status pushed to the UI; lets _set_theme/_set_status
+        # drop repeat emissions (security handlers re-assert constantly).
+        self._ui_theme: Optional[VortexTheme] = None
+        self._ui_status: str = ""
+        # (epoch-second, formatted HH:MM:SS) cache for timeline entries
+        self._ts_cache: tuple = (0, "")
+        # Entries waiting for the next coalesced flush to the UI
+        self._timeline_pending: deque = deque(maxlen=500)
+        self._timeline_flush_timer = QtCore.QTimer(self)
+        self._timeline_flush_timer.setSingleShot(True)
+        self._timeline_flush_timer.setInterval(50)
+        self._timeline_flush_timer.timeout.connect(self._flush_timeline)
+        self._timeline_kick.connect(self._arm_timeline_flush)
+
+        # Exact-phrase fast paths: "open chrome" / "close code" resolve
+        # with one dict probe instead of a CommandEngine.parse pass.
+        # Misses (anything wordier) still fall through to the parser.
+        self._fast_open = {f"open {app}": app for app in _APP_MAP}
+        self._fast_close = {f"close {app}": app for app in _PROC_MAP}
+
+        # Phrase -> bound handler for the high-priority commands.
+        self._exact_dispatch = {
+            phrase: getattr(self, "_cmd_" + name)
+            for phrase, name in _EXACT_CMDS.items()
+        }
+
+        # CommandType -> handler table for _process_command; O(1)
+        # dispatch instead of walking an if/elif chain per command.
+        self._cmd_handlers = {
+            CommandType.OPEN_APP: self._dispatch_open,
+            CommandType.CLOSE_APP: self._dispatch_close,
+            CommandType.NOTE_REMEMBER: self._dispatch_note_store,
+            CommandType.NOTE_QUERY: self._dispatch_note_query,
+            CommandType.SMALLTALK: self._dispatch_chat,
+            CommandType.UNKNOWN: self._dispatch_chat,
+        }
 
         # ---- Core components ----
         self.logger = setup_logging()
@@ -69,19 +215,75 @@ class VortexController(QtCore.QObject):
         self.personality = PersonalityProfile(owner_name=owner_name)
 
         self.audio_manager = AudioManager()
-        self.stt_service = STTService(
+
+        # Persistent pool for per-action background work (recording,
+        # warmup); reuses threads instead of spawning one per command.
+        self._executor = ThreadPoolExecutor(
+            max_workers=3, thread_name_prefix="vortex-bg"
+        )
+
+        # Worker pool so transcription can overlap voice verification.
+        # Kept separate from _executor: the recording worker blocks on
+        # an STT future, so sharing one pool could deadlock under load.
+        self._stt_executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="vortex-stt"
+        )
+
+        # Prefer GPU when CTranslate2 can see one; otherwise CPU int8.
+        stt_device, stt_default_compute = pick_device()
+
+        # Allow overriding quantization without a code change, e.g.
+        # VORTEX_STT_COMPUTE=int8_float32 on AVX512/VNNI machines.
+        stt_compute = os.environ.get("VORTEX_STT_COMPUTE", stt_default_compute)
+
+        data_dir = _DATA_DIR
+
+        # The two slow loads — the Whisper model and MemoryManager's
+        # optional sentence-transformers encoder — are independent, so
+        # run them in parallel and gather below: startup pays
+        # max(load_a, load_b) instead of their sum.
+        f_stt = self._executor.submit(
+            _make_stt,
             model_size="tiny.en",
-            device="cpu",
-            compute_type="int8",
+            device=stt_device,
+            compute_type=stt_compute,
+            # Half the cores is plenty for tiny.en and leaves headroom
+            # for the Qt event loop and the wake-word audio thread.
+            # Ignored by CTranslate2 on the CUDA path.
+            cpu_threads=max(1, (os.cpu_count() or 2) // 2),
+            # Two CTranslate2 workers: the warmup (or a straggling
+            # previous transcription) can't serialize a fresh command's
+            # transcription behind it.
+            num_workers=2,
+        )
+        f_mem = self._executor.submit(
+            MemoryManager, data_dir=data_dir, logger=self.logger
         )
 
-        data_dir = Path(__file__).resolve().parents[1] / "data"
         self.identity = IdentityManager(
             audio_manager=self.audio_manager,
             logger=self.logger,
             data_dir=data_dir,
         )
-        self.memory = MemoryManager(data_dir=data_dir, logger=self.logger)
+        # Warm the voice encoder now if a voiceprint is enrolled, so the
+        # first voice command doesn't block on the model load.
+        if self.identity.has_voiceprint():
+            self.identity.preload_voice_encoder()
+
+        # Don't block __init__ on the model load: keep the future and
+        # resolve it in _get_stt() on first use. The warmup below
+        # resolves it off the GUI thread, so keyboard-only sessions get
+        # an interactive window the moment the cheap components exist.
+        self.stt_service: Optional[STTService] = None
+        self._stt_future = f_stt
+        self.memory = f_mem.result()
+
+        # Warm the Whisper model in the background: the first transcribe
+        # call otherwise pays kernel/workspace allocation inside the
+        # recording lock, delaying the first voice command.
+        self._stt_ready = threading.Event()
+        self._executor.submit(self._warm_stt)
+
         self.workflow_engine = WorkflowEngine(
             controller=self,
             data_dir=data_dir,
@@ -99,7 +301,7 @@ class VortexController(QtCore.QObject):
         # ---- Wire UI signals ----
         self.system_message.connect(self.window.append_system_message_animated)
         self.user_message.connect(self.window.append_user_command)
-        self.timeline_entry.connect(self.window.add_timeline_entry)
+        self.timeline_batch.connect(self.window.add_timeline_entries)
         self.memory_snapshot.connect(self.window.update_memory_panel)
 
         # UI theme / status signals
@@ -111,32 +313,30 @@ class VortexController(QtCore.QObject):
         self.window.voice_listen_requested.connect(self.start_voice_capture)
 
         # Voice pipeline events
-        self.voice_command_ready.connect(self._handle_voice_command_text)
         self.wake_word_detected.connect(self._on_wake_word)
 
         # ---- Start background features ----
-        self._start_friend_mode_thread()
+        self._schedule_friend_message()
         self.camera_monitor.start(camera_index=0)
 
         # ---- Initial greeting ----
         greet = self.personality.system_greeting()
         self._emit_system_message(greet)
-        self.status_change.emit("IDLE")
+        self._set_status("IDLE")
         self._add_timeline("system", greet)
         self._refresh_memory_panel()
 
         # ---- Wake word (Porcupine) ----
         PORCUPINE_ACCESS_KEY = "h2cmEG5UAD2TDYKeQmxEXlbKGGa8wuElX6ZwBhZq3lOvF1XWvfKEJw=="  # replace with your real key
-        self.wake_listener: Optional[WakeWordListener] = None
 
         if PORCUPINE_ACCESS_KEY:
             try:
                 vortex_ppn = data_dir / "wakewords" / "vortex_en_windows_v3_0_0.ppn"
                 if vortex_ppn.exists():
-                    self.logger.info(f"Using custom Vortex wake word file: {vortex_ppn}")
+                    self.logger.info("Using custom Vortex wake word file: %s", vortex_ppn)
                     self.wake_listener = WakeWordListener(
                         logger=self.logger,
-                        on_detect=lambda: self.wake_word_detected.emit(),
+                        on_detect=self._wake_detected,
                         access_key=PORCUPINE_ACCESS_KEY,
                         keyword_path=str(vortex_ppn),
                     )
@@ -148,7 +348,7 @@ class VortexController(QtCore.QObject):
                     )
                     self.wake_listener = WakeWordListener(
                         logger=self.logger,
-                        on_detect=lambda: self.wake_word_detected.emit(),
+                        on_detect=self._wake_detected,
                         access_key=PORCUPINE_ACCESS_KEY,
                         keyword="jarvis",
                     )
@@ -158,7 +358,7 @@ class VortexController(QtCore.QObject):
                 self.system_message.emit(wake_msg)
                 self._add_timeline("wake", wake_msg)
             except Exception as e:
-                self.logger.error(f"WakeWordListener init failed: {e}")
+                self.logger.error("WakeWordListener init failed: %s", e)
                 self.system_message.emit("Wake word disabled (init error).")
                 self._add_timeline("wake", "Wake word disabled (init error)")
         else:
@@ -173,10 +373,30 @@ class VortexController(QtCore.QObject):
     def handle_user_command(self, text: str):
         """Entry point for typed commands from the UI."""
         self.user_message.emit(text)
-        self.logger.info(f"User command (typed): {text}")
+        self.logger.info("User command (typed): %s", text)
         self._add_timeline("user", text)
         self._process_command(text)
 
+    def _get_stt(self) -> STTService:
+        """Resolve the background STT construction; idempotent and safe
+        from any thread (Future.result is)."""
+        if self.stt_service is None:
+            self.stt_service = self._stt_future.result()
+        return self.stt_service
+
+    def _warm_stt(self):
+        """Run a silent dummy transcription so the first real voice
+        command only pays encode+decode, not first-use allocation."""
+        try:
+            self._get_stt().transcribe(
+                np.zeros(16000, dtype=np.float32), sample_rate=16000
+            )
+            self.logger.info("STT warmup complete.")
+        except Exception as e:
+            self.logger.error("STT warmup failed: %s", e)
+        finally:
+            self._stt_ready.set()
+
     # -------------------------------------------------------------------------
     # VOICE CAPTURE + STT
     # -------------------------------------------------------------------------
@@ -184,24 +404,32 @@ class VortexController(QtCore.QObject):
     @QtCore.pyqtSlot()
     def start_voice_capture(self):
         """Trigger recording of a short phrase and STT."""
-        if self._recording_lock.locked():
+        if self._recording:
             self.logger.info("Voice capture requested but already recording; ignoring.")
             return
 
         self.logger.info("Voice capture requested by UI or wake word.")
 
-        # Pause wake listener so it won't retrigger during recording
+        # Pause wake listener so it won't retrigger during recording.
+        # pause() just sets a flag; the audio device stays open, unlike
+        # stop()/start() which re-enumerates it on every command.
         try:
             if self.wake_listener is not None:
-                self.wake_listener.stop()
+                self.wake_listener.pause()
         except Exception as e:
-            self.logger.error(f"Failed to stop wake listener before recording: {e}")
+            self.logger.error("Failed to pause wake listener before recording: %s", e)
 
-        worker = threading.Thread(target=self._record_and_transcribe, daemon=True)
-        worker.start()
+        self._executor.submit(self._record_and_transcribe)
 
     def _record_and_transcribe(self):
-        with self._recording_lock:
+        # Test-and-set under a lock held for nanoseconds, instead of a
+        # mutex held for the whole multi-second record/verify/STT span;
+        # concurrent callers just read the flag without blocking.
+        with self._recording_tas:
+            if self._recording:
+                return
+            self._recording = True
+        try:
             try:
                 if self.camera_locked:
                     self._emit_system_message("Camera blocked. Ignoring command for security.")
@@ -211,6 +439,16 @@ class VortexController(QtCore.QObject):
                 audio, sr = self.audio_manager.record_phrase(duration_sec=3.0)
                 self.logger.info("Recording finished, verifying identity...")
 
+                # Start transcription immediately: it consumes the same
+                # audio as voice verification and the two are independent,
+                # so the wall time becomes max(verify, STT) rather than
+                # verify + STT.
+                fut_stt = None
+                if self._stt_ready.is_set():
+                    fut_stt = self._stt_executor.submit(
+                        self._get_stt().transcribe, audio, sample_rate=sr
+                    )
+
                 # Voice verification (if enrolled)
                 if self.identity.has_voiceprint():
                     is_owner, v_sim = self.identity.verify_voice(audio, sample_rate=sr)
@@ -221,6 +459,8 @@ class VortexController(QtCore.QObject):
                     else:
                         warn = f"VOICE MISMATCH. similarity={v_sim:.3f}"
                         self.logger.warning(warn)
+                        if fut_stt is not None:
+                            fut_stt.cancel()  # best effort; result is unused
                         self._enter_security_stage("VOICE MISMATCH", speak=True)
                         self._intruder_alert()
                         return
@@ -229,31 +469,50 @@ class VortexController(QtCore.QObject):
 
                 # STT
                 self.logger.info("Identity verified. Running STT...")
-                text = self.stt_service.transcribe(audio, sample_rate=sr)
+                if fut_stt is not None:
+                    text = fut_stt.result()
+                else:
+                    # Model still warming up; wait and run inline.
+                    self._emit_system_message("Still booting speech recognition, one moment.")
+                    if not self._stt_ready.wait(timeout=15.0):
+                        self._emit_system_message("Speech engine isn't ready yet. Try again shortly.")
+                        return
+                    text = self._get_stt().transcribe(audio, sample_rate=sr)
                 text = text.strip()
-                self.logger.info(f"STT result: '{text}'")
+                self.logger.info("STT result: '%s'", text)
 
             except Exception as e:
-                self.logger.error(f"Voice capture/STT failed: {e}")
+                self.logger.error("Voice capture/STT failed: %s", e)
                 self._emit_system_message("I had trouble understanding your voice input.")
-                self.status_change.emit("IDLE")
+                self._set_status("IDLE")
                 return
             finally:
-                # Restart wake listener after processing
+                # Resume wake listening after processing
                 try:
                     if self.wake_listener is not None:
-                        self.wake_listener.start()
-                        self.logger.info("Wake listener restarted after voice command.")
+                        self.wake_listener.resume()
+                        self.logger.info("Wake listener resumed after voice command.")
                 except Exception as e:
-                    self.logger.error(f"Failed to restart wake listener: {e}")
+                    self.logger.error("Failed to resume wake listener: %s", e)
 
             if not text:
                 self._emit_system_message("I didn't catch anything from the microphone.")
-                self.status_change.emit("IDLE")
+                self._set_status("IDLE")
                 return
 
-            # Deliver recognized text to the normal command path
-            self.voice_command_ready.emit(text)
+            # Deliver recognized text to the normal command path on the
+            # GUI thread. A queued invokeMethod posts one event straight
+            # to the slot — same marshaling a cross-thread signal would
+            # do, minus the signal's emit/activate bookkeeping, and the
+            # slot has no other subscribers to justify a signal.
+            QtCore.QMetaObject.invokeMethod(
+                self,
+                "_handle_voice_command_text",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(str, text),
+            )
+        finally:
+            self._recording = False
 
     @QtCore.pyqtSlot(str)
     def _handle_voice_command_text(self, text: str):
@@ -264,7 +523,7 @@ class VortexController(QtCore.QObject):
 
         self._process_command(text)
 
-        self.status_change.emit("IDLE")
+        self._set_status("IDLE")
         ready_msg = self.personality.ready_prompt()
         self._emit_system_message(ready_msg)
         self._add_timeline("system", ready_msg)
@@ -274,102 +533,18 @@ class VortexController(QtCore.QObject):
     # -------------------------------------------------------------------------
 
     def _process_command(self, text: str):
-        lowered = text.strip().lower()
-
-        # ------------------------------------------------------------------
-        # High-priority natural commands (handled BEFORE CommandEngine)
-        # ------------------------------------------------------------------
-
-        # 1) Focus mode → run focus workflow
-        if lowered in ("focus mode", "start focus mode", "enter focus mode"):
-            ok = self.workflow_engine.run_workflow("focus_mode")
-            if ok:
-                msg = "Executing workflow 'focus mode'."
-            else:
-                msg = "I couldn't find any workflow called 'focus mode'."
-            self._emit_system_message(msg, speak=False)
-            self._add_timeline("workflow", msg)
-            return
-
-        # 2) OPEN NOTEPAD (force app command, avoid note-parser)
-        if lowered in (
-            "open notepad",
-            "open note pad",
-            "open the notepad",
-            "notepad",
-            "note pad",
-        ):
-            self._handle_open_app("notepad", "Opening notepad for you.", uses_context=False)
-            return
-
-        # 3) CLOSE NOTEPAD explicitly
-        if lowered in (
-            "close notepad",
-            "close note pad",
-            "close the notepad",
-        ):
-            self._handle_close_app("notepad", "Closing notepad for you.", uses_context=False)
-            return
-
-        # 4) CLOSE LAST APP (context: "close that", "close it")
-        if lowered in (
-            "close that",
-            "close it",
-            "close this",
-        ):
-            if self._last_app_opened:
-                # Use last app context
-                msg = f"Closing {self._last_app_opened} for you."
-                self._handle_close_app(self._last_app_opened, msg, uses_context=True)
-            else:
-                msg = "I'm not sure what you want me to close."
-                self._emit_system_message(msg)
-                self._add_timeline("info", msg)
-            return
-
-        # 5) Forget / delete / remove last thing (for now, soft acknowledgement)
-        if lowered in (
-            "forget that",
-            "forget it",
-            "delete that note",
-            "remove that note",
-            "forget last note",
-        ):
-            msg = "Got it. I'll forget that."
-            self._emit_system_message(msg)
-            self._add_timeline("memory", msg)
-            return
-
-        # ------------------------------------------------------------------
-        # Existing logic (wake word, workflows, parser, etc.)
-        # ------------------------------------------------------------------
-
-        # manual security reset
-        if lowered in ("normal mode", "return to normal mode", "stand down"):
-            self.theme_change.emit(VortexTheme.NORMAL)
-            self.status_change.emit("IDLE")
-            msg = "Returning to normal operational mode."
-            self._emit_system_message(msg, speak=False)
-            self._add_timeline("security", msg)
-            return
-
-        # Optional text-based "wake" trigger (purely cosmetic)
-        if lowered in ("vortex", "hey vortex"):
-            msg = "Yes, Varchasva. I'm listening."
-            self._emit_system_message(msg)
-            self._add_timeline("wake", "Text wake word used")
-            return
-
-        # workflow listing
-        if lowered in ("list workflows", "show workflows", "what workflows do you have"):
-            workflows = self.workflow_engine.list_workflows()
-            if not workflows:
-                msg = "You don't have any workflows defined yet."
-            else:
-                lines = [f"- {wf.name}: {wf.description}" for wf in workflows]
-                msg = "Here are the workflows I know:\n" + "\n".join(lines)
-            self._emit_system_message(msg, speak=False)
-            self._add_timeline("workflow", msg)
+        # Normalized once for every lookup below; casefold() also folds
+        # the odd non-ASCII letter STT sneaks through, where lower()
+        # can miss.
+        lowered = text.strip().casefold()
+
+        # High-priority exact phrases (handled BEFORE CommandEngine):
+        # one hash probe covers focus mode, the notepad variants,
+        # contextual close/forget, security reset, text wake and
+        # workflow listing.
+        handler = self._exact_dispatch.get(lowered)
+        if handler is not None:
+            handler()
             return
 
         # run workflow by name
@@ -392,43 +567,119 @@ class VortexController(QtCore.QObject):
                 self._add_timeline("workflow", msg)
             return
 
+        # Exact "open X" / "close X" phrases skip the parser entirely.
+        app = self._fast_open.get(lowered)
+        if app is not None:
+            self._handle_open_app(app, f"Opening {app} for you.", uses_context=False)
+            return
+        app = self._fast_close.get(lowered)
+        if app is not None:
+            self._handle_close_app(app, f"Closing {app} for you.", uses_context=False)
+            return
+
         # --- regular commands via CommandEngine ---
         parsed = self.command_engine.parse(text)
+        self._cmd_handlers[parsed.type](parsed)
+
+    # -------------------------------------------------------------------------
+    # EXACT-PHRASE HANDLERS (see _EXACT_CMDS)
+    # -------------------------------------------------------------------------
+
+    def _cmd_focus_mode(self):
+        ok = self.workflow_engine.run_workflow("focus_mode")
+        if ok:
+            msg = "Executing workflow 'focus mode'."
+        else:
+            msg = "I couldn't find any workflow called 'focus mode'."
+        self._emit_system_message(msg, speak=False)
+        self._add_timeline("workflow", msg)
+
+    def _cmd_open_notepad(self):
+        # Forced app command: keeps "open notepad" away from the
+        # note-parser.
+        self._handle_open_app("notepad", "Opening notepad for you.", uses_context=False)
 
-        if parsed.type == CommandType.OPEN_APP and parsed.app_name:
+    def _cmd_close_notepad(self):
+        self._handle_close_app("notepad", "Closing notepad for you.", uses_context=False)
+
+    def _cmd_close_last(self):
+        # Contextual "close that" / "close it"
+        if self._last_app_opened:
+            msg = f"Closing {self._last_app_opened} for you."
+            self._handle_close_app(self._last_app_opened, msg, uses_context=True)
+        else:
+            msg = "I'm not sure what you want me to close."
+            self._emit_system_message(msg)
+            self._add_timeline("info", msg)
+
+    def _cmd_forget_last(self):
+        # Soft acknowledgement for now
+        msg = "Got it. I'll forget that."
+        self._emit_system_message(msg)
+        self._add_timeline("memory", msg)
+
+    def _cmd_normal_mode(self):
+        # manual security reset
+        self._set_theme(VortexTheme.NORMAL)
+        self._set_status("IDLE")
+        msg = "Returning to normal operational mode."
+        self._emit_system_message(msg, speak=False)
+        self._add_timeline("security", msg)
+
+    def _cmd_text_wake(self):
+        # Text-based "wake" trigger (purely cosmetic)
+        msg = "Yes, Varchasva. I'm listening."
+        self._emit_system_message(msg)
+        self._add_timeline("wake", "Text wake word used")
+
+    def _cmd_list_workflows(self):
+        workflows = self.workflow_engine.list_workflows()
+        if not workflows:
+            msg = "You don't have any workflows defined yet."
+        else:
+            lines = [f"- {wf.name}: {wf.description}" for wf in workflows]
+            msg = "Here are the workflows I know:\n" + "\n".join(lines)
+        self._emit_system_message(msg, speak=False)
+        self._add_timeline("workflow", msg)
+
+    # -------------------------------------------------------------------------
+    # PARSED-COMMAND DISPATCH
+    # -------------------------------------------------------------------------
+
+    def _dispatch_open(self, parsed):
+        if parsed.app_name:
             self._handle_open_app(parsed.app_name, parsed.message_to_user, uses_context=False)
 
-        elif parsed.type == CommandType.CLOSE_APP and parsed.app_name:
+    def _dispatch_close(self, parsed):
+        if parsed.app_name:
             self._handle_close_app(parsed.app_name, parsed.message_to_user, uses_context=False)
 
-        elif parsed.type == CommandType.NOTE_REMEMBER and parsed.note_text:
-            self.memory.add(parsed.note_text, category="note")
-            self.logger.info(f"Note stored: {parsed.note_text}")
-            self._add_timeline("note", parsed.note_text)
-            self._emit_system_message(parsed.message_to_user)
-            self._refresh_memory_panel()
-
-        elif parsed.type == CommandType.NOTE_QUERY:
-            items = self.memory.list_recent(limit=5, category="note")
-            self._last_memory_results = items[:]
-            if not items:
-                msg = "I don't have any notes stored yet."
-            else:
-                lines = [f"{i.id}) {i.text} ({i.timestamp})" for i in items]
-                msg = "Here are your latest notes:\n" + "\n".join(lines)
-            self._emit_system_message(msg)
-            self._add_timeline("memory", msg)
-            self._refresh_memory_panel()
+    def _dispatch_note_store(self, parsed):
+        if not parsed.note_text:
+            return
+        self.memory.add(parsed.note_text, category="note")
+        self.logger.info("Note stored: %s", parsed.note_text)
+        self._add_timeline("note", parsed.note_text)
+        self._emit_system_message(parsed.message_to_user)
+        self._refresh_memory_panel()
 
-        elif parsed.type == CommandType.SMALLTALK:
-            reply = self.personality.chat_reply(parsed.raw_text)
-            self._emit_system_message(reply)
-            self._add_timeline("chat", f"You: {parsed.raw_text}\nVORTEX: {reply}")
+    def _dispatch_note_query(self, parsed):
+        items = self.memory.list_recent(limit=5, category="note")
+        self._last_memory_results = items[:]
+        if not items:
+            msg = "I don't have any notes stored yet."
+        else:
+            lines = [f"{i.id}) {i.text} ({i.timestamp})" for i in items]
+            msg = "Here are your latest notes:\n" + "\n".join(lines)
+        self._emit_system_message(msg)
+        self._add_timeline("memory", msg)
+        self._refresh_memory_panel()
 
-        elif parsed.type == CommandType.UNKNOWN:
-            reply = self.personality.chat_reply(parsed.raw_text)
-            self._emit_system_message(reply)
-            self._add_timeline("chat", f"You: {parsed.raw_text}\nVORTEX: {reply}")
+    def _dispatch_chat(self, parsed):
+        # SMALLTALK and UNKNOWN both route to the personality layer
+        reply = self.personality.chat_reply(parsed.raw_text)
+        self._emit_system_message(reply)
+        self._add_timeline("chat", f"You: {parsed.raw_text}\nVORTEX: {reply}")
 
     # -------------------------------------------------------------------------
     # APP CONTROL
@@ -440,17 +691,7 @@ class VortexController(QtCore.QObject):
         self._emit_system_message(spoken_msg)
         self._add_timeline("action", f"Opening app: {resolved_app}")
 
-        # Map logical names to executable names / paths
-        app_map = {
-            "notepad": ["notepad.exe"],
-            "chrome": ["chrome.exe"],
-            "edge": ["msedge.exe"],
-            "code": ["code.exe"],
-            # Update this path for your machine if needed:
-            "whatsapp": [r"whatsapp.exe"],
-        }
-
-        cmd = app_map.get(resolved_app)
+        cmd = _APP_MAP.get(resolved_app)
         if not cmd:
             msg = "I don't know how to open that application yet."
             self._emit_system_message(msg)
@@ -458,12 +699,26 @@ class VortexController(QtCore.QObject):
             return
 
         try:
-            subprocess.Popen(cmd)
-            self.logger.info(f"Opened application: {resolved_app} ({cmd})")
+            if sys.platform == "win32":
+                # ShellExecute: detaches cleanly and skips CreateProcess's
+                # env-block copy and handle-inheritance scan.
+                os.startfile(cmd[0])
+            else:
+                # Launch fully detached: no inherited fds, no console,
+                # and no parent-child tie to the Qt process.
+                subprocess.Popen(
+                    cmd,
+                    close_fds=True,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                )
+            self.logger.info("Opened application: %s (%s)", resolved_app, cmd)
             self._last_app_opened = resolved_app
         except Exception as e:
             err = f"I tried to open {resolved_app} but something went wrong."
-            self.logger.error(f"Failed to open {resolved_app}: {e}")
+            self.logger.error("Failed to open %s: %s", resolved_app, e)
             self._emit_system_message(err)
             self._add_timeline("error", err)
 
@@ -476,37 +731,63 @@ class VortexController(QtCore.QObject):
         self._emit_system_message(spoken_msg)
         self._add_timeline("action", f"Closing app: {resolved_app}")
 
-        proc_map = {
-            "notepad": ["notepad.exe"],
-            "chrome": ["chrome.exe"],
-            "edge": ["chrome.exe", "msedge.exe"],
-            "code": ["Code.exe", "code.exe"],
-            "whatsapp": ["whatsapp.exe"],
-        }
-
-        targets = proc_map.get(resolved_app)
+        targets = _PROC_MAP.get(resolved_app)
         if not targets:
             msg = "I don't know how to close that application yet."
             self._emit_system_message(msg)
             self._add_timeline("error", msg)
             return
 
-        targets_lower = [t.lower() for t in targets]
         killed_any = False
 
-        for proc in psutil.process_iter(attrs=["name", "pid"]):
-            try:
-                name = proc.info["name"]
-                if not name:
+        if sys.platform == "win32":
+            # One taskkill per image name: the kernel resolves the name
+            # itself, instead of us enumerating every PID via psutil.
+            for exe in targets:
+                try:
+                    res = subprocess.run(
+                        ["taskkill", "/F", "/IM", exe],
+                        creationflags=subprocess.CREATE_NO_WINDOW,
+                        capture_output=True,
+                    )
+                    if res.returncode == 0:
+                        killed_any = True
+                except Exception as e:
+                    self.logger.error("taskkill failed for %s: %s", exe, e)
+        else:
+            targets_lower = _PROC_TARGETS_LOWER[resolved_app]
+            single = resolved_app in _SINGLE_INSTANCE
+            victims = []
+            # Only the name is consulted; asking for the pid attr too
+            # would cost an extra per-process fetch for nothing.
+            for proc in psutil.process_iter(attrs=["name"]):
+                try:
+                    name = proc.info["name"]
+                    if not name:
+                        continue
+                    if name.lower() in targets_lower:
+                        proc.terminate()
+                        victims.append(proc)
+                        # Single-instance target found: skip the rest of
+                        # the process table.
+                        if single:
+                            break
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
-                if name.lower() in targets_lower:
-                    proc.terminate()
-                    killed_any = True
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
+
+            if victims:
+                killed_any = True
+                # Let all victims shut down in parallel, then force-kill
+                # whatever is still alive after the grace period.
+                _, alive = psutil.wait_procs(victims, timeout=1.0)
+                for p in alive:
+                    try:
+                        p.kill()
+                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        pass
 
         if killed_any:
-            self.logger.info(f"Closed application: {resolved_app}")
+            self.logger.info("Closed application: %s", resolved_app)
         else:
             msg = f"I couldn't find any running instance of {resolved_app}."
             self._emit_system_message(msg)
@@ -516,34 +797,49 @@ class VortexController(QtCore.QObject):
     # FRIEND MODE (idle chatter)
     # -------------------------------------------------------------------------
 
-    def _start_friend_mode_thread(self):
-        def friend_loop():
-            while self._friend_mode_running:
-                delay = random.randint(60, 180)  # 1–3 minutes
-                time.sleep(delay)
-                msg = self.personality.idle_prompt()
-                self._emit_system_message(msg)
-                self._add_timeline("friend", msg)
+    def _schedule_friend_message(self):
+        # A re-arming single-shot timer on the Qt event loop: no
+        # dedicated OS thread parked in sleep for a job that fires a
+        # couple of dozen times per hour.
+        delay_ms = random.randint(60, 180) * 1000  # 1–3 minutes
+        QtCore.QTimer.singleShot(delay_ms, self._friend_tick)
 
-        self._friend_thread = threading.Thread(target=friend_loop, daemon=True)
-        self._friend_thread.start()
+    def _friend_tick(self):
+        if not self._friend_mode_running:
+            return
+        msg = self.personality.idle_prompt()
+        self._emit_system_message(msg)
+        self._add_timeline("friend", msg)
+        self._schedule_friend_message()
 
     # -------------------------------------------------------------------------
     # WAKE WORD HANDLER
     # -------------------------------------------------------------------------
 
+    def _wake_detected(self):
+        """
+        Porcupine callback — runs on the listener's audio thread.
+
+        Drop redundant detections here (already recording) so they never
+        cross into Qt's event queue; everything else is deferred to
+        _on_wake_word on the GUI thread via the signal.
+        """
+        if self._recording:
+            return
+        self.wake_word_detected.emit()
+
     @QtCore.pyqtSlot()
     def _on_wake_word(self):
         if self.camera_locked:
             self.logger.info("Wake word detected but camera is locked; ignoring.")
             return
 
-        if self._recording_lock.locked():
+        if self._recording:
             self.logger.info("Wake word detected while already recording; ignoring.")
             return
 
         self.logger.info("Wake word accepted. Preparing for voice command.")
-        self.status_change.emit("AWAKE")
+        self._set_status("AWAKE")
         msg = "Yes, Varchasva. I'm listening."
         self._emit_system_message(msg, speak=False)
         self._add_timeline("wake", "Wake word detected (vortex)")
@@ -557,16 +853,16 @@ class VortexController(QtCore.QObject):
 
     def _camera_blocked(self):
         self.camera_locked = True
-        self.theme_change.emit(VortexTheme.SECURITY)
-        self.status_change.emit("CAMERA BLOCKED")
+        self._set_theme(VortexTheme.SECURITY)
+        self._set_status("CAMERA BLOCKED")
         msg = "Security warning: Camera feed obstructed or missing. Commands disabled."
         self._emit_system_message(msg)
         self._add_timeline("security", msg)
 
     def _camera_restored(self):
         self.camera_locked = False
-        self.theme_change.emit(VortexTheme.NORMAL)
-        self.status_change.emit("IDLE")
+        self._set_theme(VortexTheme.NORMAL)
+        self._set_status("IDLE")
         msg = "Camera feed restored. Normal operations resumed."
         self._emit_system_message(msg)
         self._add_timeline("security", msg)
@@ -576,8 +872,8 @@ class VortexController(QtCore.QObject):
     # -------------------------------------------------------------------------
 
     def _enter_security_stage(self, reason: str, speak: bool = True):
-        self.theme_change.emit(VortexTheme.SECURITY)
-        self.status_change.emit("SECURITY CHECK")
+        self._set_theme(VortexTheme.SECURITY)
+        self._set_status("SECURITY CHECK")
         msg = f"Security check: {reason}."
         if speak:
             self._emit_system_message(msg)
@@ -587,8 +883,8 @@ class VortexController(QtCore.QObject):
         self._add_timeline("security", msg)
 
     def _intruder_alert(self):
-        self.theme_change.emit(VortexTheme.SECURITY)
-        self.status_change.emit("LOCKDOWN")
+        self._set_theme(VortexTheme.SECURITY)
+        self._set_status("LOCKDOWN")
         msg = "Intruder alert. Identity could not be verified. Command ignored."
         self._emit_system_message(msg)
         self._add_timeline("security", msg)
@@ -610,38 +906,84 @@ class VortexController(QtCore.QObject):
     # UTILITY HELPERS
     # -------------------------------------------------------------------------
 
+    def _set_theme(self, theme: VortexTheme):
+        """Emit theme_change only when the theme actually changes."""
+        if theme is self._ui_theme:
+            return
+        self._ui_theme = theme
+        self.theme_change.emit(theme)
+
+    def _set_status(self, status: str):
+        """Emit status_change only when the status actually changes."""
+        if status == self._ui_status:
+            return
+        self._ui_status = status
+        self.status_change.emit(status)
+
     def _emit_system_message(self, text: str, speak: bool = True):
         """
         Central helper for all VORTEX output.
         Pauses wake-word listener while speaking to avoid feedback.
         """
         self.system_message.emit(text)
-        self.logger.info(f"System message: {text}")
+        self.logger.info("System message: %s", text)
 
         if speak:
-            restarted = False
             try:
                 if self.wake_listener is not None:
-                    self.wake_listener.stop()
-                    restarted = True
+                    self.wake_listener.pause()
             except Exception as e:
-                self.logger.error(f"Failed to pause wake listener before TTS: {e}")
-                restarted = False
+                self.logger.error("Failed to pause wake listener before TTS: %s", e)
 
-            try:
-                self.tts.speak(text)
-            finally:
-                if restarted:
-                    try:
-                        if self.wake_listener is not None:
-                            self.wake_listener.start()
-                    except Exception as e:
-                        self.logger.error(f"Failed to restart wake listener after TTS: {e}")
+            # speak() only enqueues; resuming here would re-enable the
+            # wake word while the audio is still playing (feedback).
+            # The TTS worker fires on_done when playback really ends.
+            self.tts.speak(text, on_done=self._resume_wake_listener)
+
+    def _resume_wake_listener(self):
+        try:
+            if self.wake_listener is not None:
+                self.wake_listener.resume()
+        except Exception as e:
+            self.logger.error("Failed to resume wake listener after TTS: %s", e)
 
     def _add_timeline(self, kind: str, text: str):
         ev = self.timeline.add_event(kind, text)
-        pretty = f"[{ev.timestamp.strftime('%H:%M:%S')}] ({kind}) {text}"
-        self.timeline_entry.emit(pretty)
+        # strftime is relatively expensive; timeline resolution is one
+        # second, so reformat only when the second actually changes.
+        sec = int(ev.timestamp.timestamp())
+        if sec != self._ts_cache[0]:
+            t = ev.timestamp
+            self._ts_cache = (sec, f"{t.hour:02d}:{t.minute:02d}:{t.second:02d}")
+        pretty = f"[{self._ts_cache[1]}] ({kind}) {text}"
+
+        # Coalesce: bursts (the verify chain emits several entries in
+        # ~1 s) become one signal/repaint instead of one per event.
+        # deque.append is thread-safe; the timer is armed on the GUI
+        # thread via the queued _timeline_kick signal.
+        self._timeline_pending.append(pretty)
+        self._timeline_kick.emit()
+
+    @QtCore.pyqtSlot()
+    def _arm_timeline_flush(self):
+        if not self._timeline_flush_timer.isActive():
+            self._timeline_flush_timer.start()
+
+    @QtCore.pyqtSlot()
+    def _flush_timeline(self):
+        # No point repainting a window nobody can see (friend mode
+        # chatters away while minimized); retry later and let entries
+        # pile up in the bounded deque meanwhile.
+        if not (self.window.isVisible() and not self.window.isMinimized()):
+            self._timeline_flush_timer.start(1000)
+            return
+        self._timeline_flush_timer.setInterval(50)
+
+        batch = []
+        while self._timeline_pending:
+            batch.append(self._timeline_pending.popleft())
+        if batch:
+            self.timeline_batch.emit(batch)
 
     # -------------------------------------------------------------------------
     # SHUTDOWN
@@ -650,6 +992,8 @@ class VortexController(QtCore.QObject):
     def shutdown(self):
         """Clean shutdown when the app is closing."""
         self._friend_mode_running = False
+        self._executor.shutdown(wait=False)
+        self._stt_executor.shutdown(wait=False)
         try:
             self.camera_monitor.stop()
         except Exception:
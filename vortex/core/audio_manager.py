@@ -15,26 +15,83 @@ import numpy as np
 
 
 class AudioManager:
+    # Energy gate tunables: a 30 ms frame below SILENCE_RMS counts as
+    # silence; recording stops TRAILING_SILENCE_SEC after speech ends.
+    FRAME_SEC = 0.03
+    SILENCE_RMS = 0.01
+    TRAILING_SILENCE_SEC = 0.4
+
     def __init__(self, sample_rate: int = 16000, channels: int = 1):
         self.sample_rate = sample_rate
         self.channels = channels
 
+        # Reused capture buffers, grown on demand. record_phrase streams
+        # device-native int16 frames into _buf_i16, converts once into
+        # _buf and returns a view, so a command costs zero audio
+        # allocations after the first recording.
+        self._buf_i16: np.ndarray = np.empty(0, dtype=np.int16)
+        self._buf: np.ndarray = np.empty(0, dtype=np.float32)
+
     def record_phrase(self, duration_sec: float = 4.0) -> tuple[np.ndarray, int]:
         """
         Record a short audio phrase from the default microphone.
 
+        Stops early once the speaker has gone quiet for a short while,
+        so a one-word command doesn't pay the full duration and doesn't
+        feed seconds of silence into STT. duration_sec is the hard cap.
+
         Returns:
             (audio_samples, sample_rate)
-            audio_samples is a 1D float32 numpy array in range [-1, 1]
+            audio_samples is a 1D float32 numpy array in range [-1, 1].
+            It is a view into an internal buffer that stays valid until
+            the next recording starts; callers finish with it first
+            (the controller's single-recording guard ensures this).
         """
-        frames = int(duration_sec * self.sample_rate)
-        recording = sd.rec(
-            frames,
+        block = int(self.sample_rate * self.FRAME_SEC)
+        max_frames = int(duration_sec * self.sample_rate)
+        silence_blocks_needed = int(self.TRAILING_SILENCE_SEC / self.FRAME_SEC)
+        # Energy gate threshold expressed in raw int16 units, so the
+        # per-block RMS check needs no float conversion of the samples.
+        silence_rms_i16 = self.SILENCE_RMS * 32768.0
+
+        if self._buf.size < max_frames:
+            self._buf_i16 = np.empty(max_frames, dtype=np.int16)
+            self._buf = np.empty(max_frames, dtype=np.float32)
+        buf_i16 = self._buf_i16
+
+        collected = 0
+        speech_seen = False
+        silence_run = 0
+
+        # Capture in the device's native int16: PortAudio then moves
+        # half the bytes per block and skips its own sample-by-sample
+        # float conversion; we convert once, vectorized, at the end.
+        with sd.InputStream(
             samplerate=self.sample_rate,
             channels=self.channels,
-            dtype="float32",
-        )
-        sd.wait()  # blocking until recording is done
-        # Flatten to mono 1D array
-        audio = recording.reshape(-1)
-        return audio, self.sample_rate
+            blocksize=block,
+            dtype="int16",
+        ) as stream:
+            while collected < max_frames:
+                data, _ = stream.read(block)
+                n = min(len(data), max_frames - collected)
+                buf_i16[collected : collected + n] = data[:n, 0]
+                mono = buf_i16[collected : collected + n]
+                collected += n
+
+                # np.square with a float dtype both converts and avoids
+                # int16 overflow in the product.
+                rms = float(np.sqrt(np.mean(np.square(mono, dtype=np.float32))))
+                if rms >= silence_rms_i16:
+                    speech_seen = True
+                    silence_run = 0
+                elif speech_seen:
+                    silence_run += 1
+                    if silence_run >= silence_blocks_needed:
+                        break
+
+        # Single vectorized int16 -> [-1, 1] float32 conversion into the
+        # reused output buffer.
+        out = self._buf[:collected]
+        np.multiply(buf_i16[:collected], np.float32(1.0 / 32768.0), out=out)
+        return out, self.sample_rate
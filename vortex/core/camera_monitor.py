@@ -4,6 +4,7 @@ import cv2
 import numpy as np
 import threading
 import time
+from contextlib import contextmanager
 
 
 class CameraMonitor:
@@ -24,6 +25,11 @@ class CameraMonitor:
         self.thread = None
         self.blocked_state = False  # True = currently considered blocked
 
+        # The open capture while the monitor runs; _cap_lock serializes
+        # frame reads against borrow_capture().
+        self._cap = None
+        self._cap_lock = threading.Lock()
+
         # Tunable thresholds
         self.dark_threshold = 60          # higher = more sensitive to dark frames
         self.dark_frames_required = 5     # how many consecutive dark frames before trigger
@@ -46,6 +52,20 @@ class CameraMonitor:
                 pass
         self.thread = None
 
+    @contextmanager
+    def borrow_capture(self):
+        """
+        Temporarily hand the monitor's open VideoCapture to another
+        consumer (e.g. IdentityManager.verify_face_live), so callers
+        don't pay a second camera open while the monitor already holds
+        the device. Monitoring blocks on the lock for the duration.
+
+        Yields None when the monitor has no open camera; the caller is
+        expected to open its own in that case.
+        """
+        with self._cap_lock:
+            yield self._cap
+
     def _is_dark(self, frame):
         """Check if frame is dark. Returns False if frame is invalid."""
         if frame is None:
@@ -55,7 +75,7 @@ class CameraMonitor:
             brightness = np.mean(gray)
             return brightness < self.dark_threshold
         except Exception as e:
-            self.logger.warning(f"CameraMonitor: error processing frame: {e}")
+            self.logger.warning("CameraMonitor: error processing frame: %s", e)
             return False
 
     def _run(self, camera_index):
@@ -63,6 +83,7 @@ class CameraMonitor:
         if not cap.isOpened():
             self.logger.error("CameraMonitor: unable to open webcam.")
             return
+        self._cap = cap
 
         dark_count = 0
         consecutive_failures = 0
@@ -70,8 +91,9 @@ class CameraMonitor:
 
         while self.running:
             try:
-                ret, frame = cap.read()
-                
+                with self._cap_lock:
+                    ret, frame = cap.read()
+
                 # Check if read was successful and frame is valid
                 if not ret or frame is None:
                     consecutive_failures += 1
@@ -106,7 +128,7 @@ class CameraMonitor:
                     self.callback_on_restored()
 
             except Exception as e:
-                self.logger.error(f"CameraMonitor: error reading from camera: {e}")
+                self.logger.error("CameraMonitor: error reading from camera: %s", e)
                 consecutive_failures += 1
                 if consecutive_failures >= max_failures:
                     self.logger.error("CameraMonitor: camera appears unavailable after multiple errors.")
@@ -118,8 +140,9 @@ class CameraMonitor:
 
             time.sleep(0.2)
 
+        self._cap = None
         try:
             cap.release()
         except Exception as e:
-            self.logger.warning(f"CameraMonitor: error releasing camera: {e}")
+            self.logger.warning("CameraMonitor: error releasing camera: %s", e)
         self.logger.info("CameraMonitor stopped.")
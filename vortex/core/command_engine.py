@@ -36,6 +36,9 @@ class CommandEngine:
       - otherwise falls back to SMALLTALK / UNKNOWN
     """
 
+    # How many parsed commands to remember (parse is pure per input string)
+    PARSE_CACHE_SIZE = 256
+
     def __init__(self):
         # Logical app names mapped to simple keyword triggers
         self.app_keywords = {
@@ -46,12 +49,30 @@ class CommandEngine:
             "whatsapp": ["whatsapp", "whats app"],
         }
 
+        # Cache of already-parsed inputs (insertion-ordered, oldest evicted)
+        self._parse_cache: dict = {}
+
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
 
     def parse(self, text: str) -> ParsedCommand:
         raw = text.strip()
+
+        # Repeated phrases ("open chrome", wake-word retries) are common;
+        # parsing is pure per input so a small cache skips the re-parse.
+        cached = self._parse_cache.get(raw)
+        if cached is not None:
+            return cached
+
+        parsed = self._parse(raw)
+
+        if len(self._parse_cache) >= self.PARSE_CACHE_SIZE:
+            self._parse_cache.pop(next(iter(self._parse_cache)))
+        self._parse_cache[raw] = parsed
+        return parsed
+
+    def _parse(self, raw: str) -> ParsedCommand:
         lowered = raw.lower().strip()
 
         if not lowered:
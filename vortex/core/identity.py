@@ -10,15 +10,20 @@ IdentityManager for VORTEX.
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Optional, Tuple, TYPE_CHECKING
 import threading
 
 import numpy as np
 import cv2
 
-from resemblyzer import VoiceEncoder
 from numpy.linalg import norm
-import insightface
+
+# resemblyzer and insightface are imported lazily inside the _ensure_*
+# helpers below: both are heavyweight imports (torch / onnxruntime) and
+# neither is needed until a biometric check actually runs.
+
+if TYPE_CHECKING:
+    from resemblyzer import VoiceEncoder
 
 
 def cosine_sim(a: np.ndarray, b: np.ndarray) -> float:
@@ -51,9 +56,12 @@ class IdentityManager:
         self.voice_file = self.data_dir / "voiceprint.npy"
         self.face_file = self.data_dir / "faceprint.npy"
 
-        self.voice_encoder: Optional[VoiceEncoder] = None
+        self.voice_encoder: Optional["VoiceEncoder"] = None
         self.face_app = None  # InsightFace app
 
+        # Cached voiceprint so verify_voice doesn't hit the disk per call.
+        self._voiceprint: Optional[np.ndarray] = None
+
         # thresholds: tweak as you test
         self.voice_threshold = 0.75
         self.face_threshold = 0.8  # cosine similarity for L2-normalized embeddings
@@ -64,9 +72,19 @@ class IdentityManager:
 
     # ---------- lazy model loading ----------
 
+    def preload_voice_encoder(self):
+        """
+        Warm the voice encoder on a background thread so the first
+        enrollment/verification doesn't pay the model load cost
+        (typically several hundred ms) inside the voice pipeline.
+        """
+        threading.Thread(target=self._ensure_voice_encoder, daemon=True).start()
+
     def _ensure_voice_encoder(self):
         with self._voice_lock:
             if self.voice_encoder is None:
+                from resemblyzer import VoiceEncoder
+
                 self.logger.info("Loading voice encoder (resemblyzer)...")
                 self.voice_encoder = VoiceEncoder()
                 self.logger.info("Voice encoder loaded.")
@@ -74,9 +92,21 @@ class IdentityManager:
     def _ensure_face_app(self):
         with self._face_lock:
             if self.face_app is None:
-                self.logger.info("Loading InsightFace model...")
+                import insightface
+                import onnxruntime as ort
+
+                # Prefer the GPU provider when onnxruntime was built with
+                # one; detection + embedding dominate verify latency on CPU.
+                available = set(ort.get_available_providers())
+                providers = [
+                    p
+                    for p in ("CUDAExecutionProvider", "CPUExecutionProvider")
+                    if p in available
+                ] or ["CPUExecutionProvider"]
+
+                self.logger.info("Loading InsightFace model (providers: %s)...", providers)
                 app = insightface.app.FaceAnalysis(
-                    name="buffalo_l", providers=["CPUExecutionProvider"]
+                    name="buffalo_l", providers=providers
                 )
                 app.prepare(ctx_id=0, det_size=(640, 640))
                 self.face_app = app
@@ -93,7 +123,7 @@ class IdentityManager:
 
         embeddings = []
         for i in range(samples):
-            self.logger.info(f"Voice enrollment: recording sample {i + 1}/{samples}")
+            self.logger.info("Voice enrollment: recording sample %d/%d", i + 1, samples)
             audio, sr = self.audio_manager.record_phrase(duration_sec=duration_sec)
             # resemblyzer expects 16k mono float32 in [-1, 1] → we already have that
             emb = enc.embed_utterance(audio)
@@ -104,7 +134,8 @@ class IdentityManager:
 
         mean_emb = np.mean(np.stack(embeddings, axis=0), axis=0)
         np.save(self.voice_file, mean_emb)
-        self.logger.info(f"Voiceprint saved to {self.voice_file}")
+        self._voiceprint = mean_emb
+        self.logger.info("Voiceprint saved to %s", self.voice_file)
 
     def has_voiceprint(self) -> bool:
         return self.voice_file.exists()
@@ -123,11 +154,14 @@ class IdentityManager:
         self._ensure_voice_encoder()
         enc = self.voice_encoder
 
-        stored = np.load(self.voice_file)
+        if self._voiceprint is None:
+            # mmap keeps this a single open() and defers paging to first use.
+            self._voiceprint = np.load(self.voice_file, mmap_mode="r")
+        stored = self._voiceprint
         probe = enc.embed_utterance(audio)
 
         sim = cosine_sim(stored, probe)
-        self.logger.info(f"Voice similarity: {sim:.3f}")
+        self.logger.info("Voice similarity: %.3f", sim)
         return sim >= self.voice_threshold, sim
 
     # ---------- FACE ENROLLMENT & VERIFY ----------
@@ -161,7 +195,7 @@ class IdentityManager:
                 emb = emb / (norm(emb) + 1e-9)
                 embeddings.append(emb)
                 collected += 1
-                self.logger.info(f"Face enrollment: collected {collected}/{frames}")
+                self.logger.info("Face enrollment: collected %d/%d", collected, frames)
         finally:
             cap.release()
 
@@ -172,16 +206,20 @@ class IdentityManager:
         # normalize again
         mean_emb = mean_emb / (norm(mean_emb) + 1e-9)
         np.save(self.face_file, mean_emb)
-        self.logger.info(f"Faceprint saved to {self.face_file}")
+        self.logger.info("Faceprint saved to %s", self.face_file)
 
     def has_faceprint(self) -> bool:
         return self.face_file.exists()
 
     def verify_face_live(
-        self, camera_index: int = 0, max_attempts: int = 10
+        self, camera_index: int = 0, max_attempts: int = 10, cap=None
     ) -> Tuple[bool, float]:
         """
         Capture a few frames and check if any face matches stored faceprint.
+
+        Pass an already-open cv2.VideoCapture as `cap` (e.g. borrowed
+        from CameraMonitor) to skip the camera open/release cycle; the
+        borrowed handle is left open for its owner.
         """
         if not self.face_file.exists():
             self.logger.warning("No faceprint enrolled yet.")
@@ -193,9 +231,13 @@ class IdentityManager:
         stored = np.load(self.face_file).astype(np.float32)
         stored = stored / (norm(stored) + 1e-9)
 
-        cap = cv2.VideoCapture(camera_index)
+        own_cap = cap is None
+        if own_cap:
+            cap = cv2.VideoCapture(camera_index)
         if not cap.isOpened():
             self.logger.error("Could not open webcam for face verification.")
+            if own_cap:
+                cap.release()
             return False, 0.0
 
         best_sim = -1.0
@@ -214,11 +256,12 @@ class IdentityManager:
                 emb = emb / (norm(emb) + 1e-9)
                 sim = cosine_sim(stored, emb)
                 best_sim = max(best_sim, sim)
-                self.logger.info(f"Face similarity attempt: {sim:.3f}")
+                self.logger.info("Face similarity attempt: %.3f", sim)
                 if sim >= self.face_threshold:
                     ok = True
                     break
         finally:
-            cap.release()
+            if own_cap:
+                cap.release()
 
         return ok, best_sim
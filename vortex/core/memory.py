@@ -35,7 +35,7 @@ class _SemanticEncoder:
         except Exception as e:
             if self.logger:
                 self.logger.warning(
-                    f"Semantic search disabled (sentence-transformers not available): {e}"
+                    "Semantic search disabled (sentence-transformers not available): %s", e
                 )
             return
 
@@ -48,7 +48,7 @@ class _SemanticEncoder:
         except Exception as e:
             if self.logger:
                 self.logger.warning(
-                    f"Semantic search disabled (model load failed): {e}"
+                    "Semantic search disabled (model load failed): %s", e
                 )
             self.model = None
             self.is_available = False
@@ -101,7 +101,7 @@ class _SemanticEncoder:
             return results
         except Exception as e:
             if self.logger:
-                self.logger.warning(f"Semantic search failed at runtime, falling back: {e}")
+                self.logger.warning("Semantic search failed at runtime, falling back: %s", e)
             return []
 
 
@@ -133,7 +133,7 @@ class MemoryManager:
     def _load(self):
         if not self.path.exists():
             if self.logger:
-                self.logger.info(f"Memory file not found at {self.path}, starting empty.")
+                self.logger.info("Memory file not found at %s, starting empty.", self.path)
             self._memories = []
             return
 
@@ -150,10 +150,10 @@ class MemoryManager:
                 for i, item in enumerate(raw)
             ]
             if self.logger:
-                self.logger.info(f"Loaded {len(self._memories)} memories from disk.")
+                self.logger.info("Loaded %d memories from disk.", len(self._memories))
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Failed to load memory file: {e}")
+                self.logger.error("Failed to load memory file: %s", e)
             self._memories = []
 
     def _save(self):
@@ -163,7 +163,7 @@ class MemoryManager:
                 json.dump(data, f, ensure_ascii=False, indent=2)
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Failed to save memory file: {e}")
+                self.logger.error("Failed to save memory file: %s", e)
 
     # ------------------------------------------------------------------ public: add + list + search
 
@@ -178,7 +178,7 @@ class MemoryManager:
         self._memories.append(item)
         self._save()
         if self.logger:
-            self.logger.info(f"Memory added [{item.id}] ({category}): {item.text}")
+            self.logger.info("Memory added [%s] (%s): %s", item.id, category, item.text)
         return item
 
     def list_recent(self, limit: int = 5, category: Optional[str] = None) -> List[MemoryItem]:
@@ -223,13 +223,14 @@ class MemoryManager:
             if semantic_results:
                 if self.logger:
                     self.logger.info(
-                        f"Semantic memory search used for query '{query}', "
-                        f"returned {len(semantic_results)} results."
+                        "Semantic memory search used for query '%s', returned %d results.",
+                        query,
+                        len(semantic_results),
                     )
                 return semantic_results
 
         if self.logger:
-            self.logger.info(f"No memory results for query '{query}'.")
+            self.logger.info("No memory results for query '%s'.", query)
         return []
 
     # ------------------------------------------------------------------ public: delete
@@ -247,7 +248,7 @@ class MemoryManager:
         if deleted:
             self._save()
         if self.logger:
-            self.logger.info(f"Deleted {deleted} memories (category={category}).")
+            self.logger.info("Deleted %d memories (category=%s).", deleted, category)
         return deleted
 
     def delete_by_id(self, mem_id: int, category: Optional[str] = None) -> bool:
@@ -264,11 +265,11 @@ class MemoryManager:
         if len(self._memories) < before:
             self._save()
             if self.logger:
-                self.logger.info(f"Deleted memory id={mem_id} (category={category}).")
+                self.logger.info("Deleted memory id=%s (category=%s).", mem_id, category)
             return True
 
         if self.logger:
-            self.logger.info(f"No memory found to delete with id={mem_id}.")
+            self.logger.info("No memory found to delete with id=%s.", mem_id)
         return False
 
     def delete_by_query(
@@ -292,7 +293,9 @@ class MemoryManager:
 
         if self.logger:
             self.logger.info(
-                f"Deleted {len(deleted_items)} memories via query '{query}'. "
-                f"IDs: {[m.id for m in deleted_items]}"
+                "Deleted %d memories via query '%s'. IDs: %s",
+                len(deleted_items),
+                query,
+                [m.id for m in deleted_items],
             )
         return deleted_items
@@ -17,6 +17,35 @@ class PersonalityProfile:
     - chat_reply(text): main friend-style response
     """
 
+    # Option pools built once at class creation: the prompt methods run
+    # on every command / idle tick, and random.choice on a constant
+    # tuple is all they should cost.
+    _READY_PROMPTS = (
+        "Anything else on your mind?",
+        "What do you want to do next?",
+        "I'm here if you need me.",
+        "Your move.",
+    )
+
+    _IDLE_PROMPTS = {
+        "morning": (
+            "New day, new bugs to fix. How are you feeling about today?",
+            "Morning check-in: slept enough, or are we running on coffee and stubbornness?",
+        ),
+        "afternoon": (
+            "Quick systems check: your energy seems... unknown. How are you holding up?",
+            "If you want, we can plan the rest of your day so it doesn't explode.",
+        ),
+        "evening": (
+            "Evening already. Want to wrap things up or keep grinding?",
+            "This would be a good time to review what you did today. I can help you note it.",
+        ),
+        "late": (
+            "It's pretty late. Just saying—I care more about your sleep than your code.",
+            "Night shift vibes. Need a tiny pep talk or should we call it a day?",
+        ),
+    }
+
     def __init__(self, owner_name: str = "Varchasva"):
         self.owner_name = owner_name
         self._mood: str = "neutral"
@@ -48,43 +77,14 @@ class PersonalityProfile:
         return base + " You can ask me to help, or just talk to me."
 
     def ready_prompt(self) -> str:
-        options = [
-            "Anything else on your mind?",
-            "What do you want to do next?",
-            "I'm here if you need me.",
-            "Your move.",
-        ]
-        return random.choice(options)
+        return random.choice(self._READY_PROMPTS)
 
     def idle_prompt(self) -> str:
         """
         Called from the background "friend loop".
         VORTEX talks even if you didn't say anything.
         """
-        tod = self._time_of_day()
-
-        if tod == "morning":
-            options = [
-                "New day, new bugs to fix. How are you feeling about today?",
-                "Morning check-in: slept enough, or are we running on coffee and stubbornness?",
-            ]
-        elif tod == "afternoon":
-            options = [
-                "Quick systems check: your energy seems... unknown. How are you holding up?",
-                "If you want, we can plan the rest of your day so it doesn't explode.",
-            ]
-        elif tod == "evening":
-            options = [
-                "Evening already. Want to wrap things up or keep grinding?",
-                "This would be a good time to review what you did today. I can help you note it.",
-            ]
-        else:  # late night
-            options = [
-                "It's pretty late. Just saying—I care more about your sleep than your code.",
-                "Night shift vibes. Need a tiny pep talk or should we call it a day?",
-            ]
-
-        return random.choice(options)
+        return random.choice(self._IDLE_PROMPTS[self._time_of_day()])
 
     # ---------- chat / smalltalk ----------
 
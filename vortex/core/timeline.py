@@ -9,9 +9,10 @@ Phase 1:
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List
+from typing import Deque, List
 
 
 @dataclass
@@ -22,8 +23,10 @@ class TimelineEvent:
 
 
 class TimelineManager:
-    def __init__(self):
-        self._events: List[TimelineEvent] = []
+    def __init__(self, max_events: int = 1000):
+        # Fixed-capacity ring buffer: append is O(1) and old events are
+        # dropped automatically instead of the list growing forever.
+        self._events: Deque[TimelineEvent] = deque(maxlen=max_events)
 
     def add_event(self, kind: str, text: str) -> TimelineEvent:
         ev = TimelineEvent(timestamp=datetime.now(), kind=kind, text=text)
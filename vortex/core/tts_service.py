@@ -5,7 +5,8 @@ from __future__ import annotations
 import threading
 import queue
 import subprocess
-from typing import Optional
+import time
+from typing import Callable, Optional
 
 
 class TTSService:
@@ -24,9 +25,14 @@ class TTSService:
         volume: 0 .. 100
         voice_name: optional name of a specific installed voice (or None for default).
         """
-        self._queue: "queue.Queue[str]" = queue.Queue()
+        # Items are (text, on_done) pairs; on_done may be None.
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
         self._running = True
 
+        # (text, monotonic time) of the last enqueued utterance, used to
+        # drop immediate duplicates (e.g. double-fired signals).
+        self._last_enqueued: tuple = ("", 0.0)
+
         self._rate = rate
         self._volume = volume
         self._voice_name = voice_name
@@ -36,17 +42,35 @@ class TTSService:
 
     # ---------- public API ----------
 
-    def speak(self, text: str):
+    def speak(self, text: str, on_done: Optional[Callable[[], None]] = None):
         """
         Queue text to be spoken. Non-blocking.
+
+        on_done, if given, is called from the TTS worker thread once
+        playback of this utterance has actually finished (or the
+        utterance was dropped), so callers can sequence work on real
+        playback completion instead of guessing with timers.
         """
         if not text or not self._running:
+            if on_done is not None:
+                on_done()
+            return
+
+        # Coalesce identical utterances fired in quick succession.
+        now = time.monotonic()
+        last_text, last_t = self._last_enqueued
+        if text == last_text and (now - last_t) < 0.5:
+            if on_done is not None:
+                on_done()
             return
+        self._last_enqueued = (text, now)
+
         try:
-            self._queue.put_nowait(text)
+            self._queue.put_nowait((text, on_done))
         except queue.Full:
             # avoid blocking everything if queue is somehow full
-            pass
+            if on_done is not None:
+                on_done()
 
     def shutdown(self):
         """
@@ -54,7 +78,7 @@ class TTSService:
         """
         self._running = False
         try:
-            self._queue.put_nowait("")
+            self._queue.put_nowait(("", None))
         except Exception:
             pass
         try:
@@ -102,7 +126,7 @@ class TTSService:
 
         while self._running:
             try:
-                text = self._queue.get(timeout=0.5)
+                text, on_done = self._queue.get(timeout=0.5)
             except queue.Empty:
                 continue
 
@@ -123,4 +147,9 @@ class TTSService:
             except Exception as e:
                 # If TTS fails for some reason, log and continue
                 print(f"[TTS ERROR] PowerShell TTS failed: {e}")
-                continue
+            finally:
+                if on_done is not None:
+                    try:
+                        on_done()
+                    except Exception as e:
+                        print(f"[TTS ERROR] on_done callback failed: {e}")
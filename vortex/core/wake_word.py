@@ -32,13 +32,14 @@ class WakeWordListener:
         self.logger = logger
         self.on_detect = on_detect
         self._running = False
+        self._paused = threading.Event()
         self._thread: Optional[threading.Thread] = None
 
         if not access_key:
             raise ValueError("Porcupine access_key is required for WakeWordListener")
 
         if keyword_path:
-            self.logger.info(f"WakeWordListener: using custom keyword file: {keyword_path}")
+            self.logger.info("WakeWordListener: using custom keyword file: %s", keyword_path)
             self._porcupine = pvporcupine.create(
                 access_key=access_key,
                 keyword_paths=[keyword_path],
@@ -47,14 +48,14 @@ class WakeWordListener:
             if not keyword:
                 keyword = "jarvis"
             builtins = pvporcupine.KEYWORDS
-            self.logger.info(f"Porcupine built-in keywords: {builtins}")
+            self.logger.info("Porcupine built-in keywords: %s", builtins)
             if keyword not in builtins:
                 raise ValueError(
                     f"Keyword '{keyword}' is not a built-in Porcupine keyword. "
                     f"Available: {', '.join(builtins)}"
                 )
 
-            self.logger.info(f"WakeWordListener: using built-in keyword: {keyword}")
+            self.logger.info("WakeWordListener: using built-in keyword: %s", keyword)
             self._porcupine = pvporcupine.create(
                 access_key=access_key,
                 keywords=[keyword],
@@ -83,6 +84,20 @@ class WakeWordListener:
             self._thread.join(timeout=1.0)
         self.logger.info("WakeWordListener: stopped.")
 
+    def pause(self):
+        """
+        Temporarily ignore the microphone without tearing anything down.
+
+        The audio thread keeps draining the stream (so no backlog builds
+        up) but skips Porcupine processing. Much cheaper than
+        stop()/start(), which closes and reopens the audio device.
+        """
+        self._paused.set()
+
+    def resume(self):
+        """Undo pause() and start reacting to the wake word again."""
+        self._paused.clear()
+
     # -------------- internal loop --------------
 
     def _run(self):
@@ -94,12 +109,16 @@ class WakeWordListener:
                 dtype="int16",
             ) as stream:
                 self.logger.info(
-                    f"WakeWordListener: audio stream opened "
-                    f"(sample_rate={self.sample_rate}, frame_length={self.frame_length})"
+                    "WakeWordListener: audio stream opened "
+                    "(sample_rate=%s, frame_length=%s)",
+                    self.sample_rate,
+                    self.frame_length,
                 )
 
                 while self._running:
                     audio_frame, _ = stream.read(self.frame_length)
+                    if self._paused.is_set():
+                        continue
                     pcm = np.frombuffer(audio_frame, dtype=np.int16)
 
                     keyword_index = self._porcupine.process(pcm)
@@ -108,8 +127,8 @@ class WakeWordListener:
                         try:
                             self.on_detect()
                         except Exception as cb_err:
-                            self.logger.error(f"WakeWordListener: callback error: {cb_err}")
+                            self.logger.error("WakeWordListener: callback error: %s", cb_err)
         except Exception as e:
-            self.logger.error(f"WakeWordListener: error in loop: {e}")
+            self.logger.error("WakeWordListener: error in loop: %s", e)
         finally:
             self.logger.info("WakeWordListener: exiting audio loop.")
@@ -86,7 +86,7 @@ class WorkflowEngine:
                 self.workflows[key] = wf
             except Exception as e:
                 if self.logger:
-                    self.logger.error(f"Failed to load workflow from {path}: {e}")
+                    self.logger.error("Failed to load workflow from %s: %s", path, e)
 
     def _create_sample_workflow(self):
         """
@@ -111,10 +111,10 @@ class WorkflowEngine:
         try:
             path.write_text(json.dumps(sample, indent=2), encoding="utf-8")
             if self.logger:
-                self.logger.info(f"Created sample workflow at {path}")
+                self.logger.info("Created sample workflow at %s", path)
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Failed to create sample workflow: {e}")
+                self.logger.error("Failed to create sample workflow: %s", e)
 
     # ---------- public API ----------
 
@@ -139,7 +139,7 @@ class WorkflowEngine:
 
     def _run_workflow_thread(self, wf: Workflow):
         if self.logger:
-            self.logger.info(f"Running workflow: {wf.name}")
+            self.logger.info("Running workflow: %s", wf.name)
 
         self.controller._emit_system_message(
             f"Starting workflow '{wf.name}'.",
@@ -151,7 +151,7 @@ class WorkflowEngine:
                 self._execute_step(step, wf)
             except Exception as e:
                 if self.logger:
-                    self.logger.error(f"Error in workflow '{wf.name}' step {step.type}: {e}")
+                    self.logger.error("Error in workflow '%s' step %s: %s", wf.name, step.type, e)
 
         self.controller._emit_system_message(
             f"Workflow '{wf.name}' completed.",
@@ -192,7 +192,7 @@ class WorkflowEngine:
 
         else:
             if self.logger:
-                self.logger.warning(f"Workflow '{wf.name}': unknown step type '{step.type}'")
+                self.logger.warning("Workflow '%s': unknown step type '%s'", wf.name, step.type)
 
     # ---------- helpers ----------
 
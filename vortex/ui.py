@@ -5,6 +5,7 @@ from __future__ import annotations
 from enum import Enum, auto
 
 from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QTextCursor
 from PyQt6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -62,9 +63,25 @@ class VortexWindow(QMainWindow):
     RED = "#FF0033"
     BLACK = "#000000"
 
+    # Oldest console lines are trimmed by Qt once this many blocks exist.
+    MAX_CONSOLE_LINES = 500
+    # Cap for the Commands/Timeline side lists.
+    MAX_LIST_ITEMS = 200
+
+    # Constant HTML fragments reused on every console append.
+    _VORTEX_PREFIX = f'<span style="color:{BLUE};">[VORTEX]</span> '
+    _YOU_PREFIX = f'<span style="color:{BLUE};">[YOU]</span> '
+
     def __init__(self):
         super().__init__()
 
+        # Built stylesheets per theme; the strings only depend on class
+        # constants, so build each one once and reuse it.
+        self._theme_styles: dict[VortexTheme, str] = {}
+        # Last applied theme/status, used to skip redundant re-styling.
+        self._current_theme: VortexTheme | None = None
+        self._current_status: str = ""
+
         self.setWindowTitle("V.O.R.T.E.X")
         # Start maximized by default
         self.setWindowState(self.windowState() | Qt.WindowState.WindowMaximized)
@@ -110,6 +127,9 @@ class VortexWindow(QMainWindow):
         self.console.setReadOnly(True)
         self.console.setObjectName("console")
         self.console.setAcceptRichText(True)
+        # Let Qt drop the oldest blocks internally instead of the console
+        # document growing without bound over a long session.
+        self.console.document().setMaximumBlockCount(self.MAX_CONSOLE_LINES)
 
         console_layout.addWidget(self.console)
 
@@ -125,11 +145,15 @@ class VortexWindow(QMainWindow):
         # Commands tab: just a list of user commands
         self.commands_list = QListWidget()
         self.commands_list.setObjectName("commandsList")
+        # All rows are single-line monospace text; let Qt measure one row
+        # and skip per-row sizing on insert.
+        self.commands_list.setUniformItemSizes(True)
         self.tabs.addTab(self.commands_list, "Commands")
 
         # Timeline tab: system events
         self.timeline_list = QListWidget()
         self.timeline_list.setObjectName("timelineList")
+        self.timeline_list.setUniformItemSizes(True)
         self.tabs.addTab(self.timeline_list, "Timeline")
 
         # Memory tab: multi-line text
@@ -204,8 +228,8 @@ class VortexWindow(QMainWindow):
         if not text:
             return
         html = (
-            f'<span style="color:{self.BLUE};">[VORTEX]</span> '
-            f'<span style="color:{self.GREEN};">{self._escape(text)}</span>'
+            self._VORTEX_PREFIX
+            + f'<span style="color:{self.GREEN};">{self._escape(text)}</span>'
         )
         self._append_console_html(html)
 
@@ -218,12 +242,14 @@ class VortexWindow(QMainWindow):
             return
 
         html = (
-            f'<span style="color:{self.BLUE};">[YOU]</span> '
-            f'<span style="color:{self.GREEN};">{self._escape(text)}</span>'
+            self._YOU_PREFIX
+            + f'<span style="color:{self.GREEN};">{self._escape(text)}</span>'
         )
         self._append_console_html(html)
 
         self.commands_list.addItem(QListWidgetItem(text))
+        while self.commands_list.count() > self.MAX_LIST_ITEMS:
+            self.commands_list.takeItem(0)
         self.commands_list.scrollToBottom()
 
     def add_timeline_entry(self, text: str):
@@ -231,6 +257,25 @@ class VortexWindow(QMainWindow):
         Add an entry string to the Timeline tab.
         """
         self.timeline_list.addItem(QListWidgetItem(text))
+        while self.timeline_list.count() > self.MAX_LIST_ITEMS:
+            self.timeline_list.takeItem(0)
+        self.timeline_list.scrollToBottom()
+
+    def add_timeline_entries(self, entries: list):
+        """
+        Add a batch of timeline entries with a single repaint:
+        trim + scroll once instead of per entry.
+        """
+        if not entries:
+            return
+        self.timeline_list.setUpdatesEnabled(False)
+        try:
+            for text in entries:
+                self.timeline_list.addItem(QListWidgetItem(text))
+            while self.timeline_list.count() > self.MAX_LIST_ITEMS:
+                self.timeline_list.takeItem(0)
+        finally:
+            self.timeline_list.setUpdatesEnabled(True)
         self.timeline_list.scrollToBottom()
 
     def update_memory_panel(self, text: str):
@@ -241,14 +286,20 @@ class VortexWindow(QMainWindow):
 
     def set_status(self, text: str):
         """
-        Update the top status label.
+        Update the top status label. No-op if the status is unchanged.
         """
+        if text == self._current_status:
+            return
+        self._current_status = text
         self.status_label.setText(f"STATUS: {text}")
 
     def set_theme(self, theme: VortexTheme):
         """
         Public entry point to switch the visual theme.
+        Skips the (expensive) stylesheet re-apply if already active.
         """
+        if theme is self._current_theme:
+            return
         self._apply_theme_styles(theme)
 
     # ------------------------------------------------------------------ #
@@ -267,20 +318,29 @@ class VortexWindow(QMainWindow):
 
     def _append_console_html(self, html: str):
         """
-        Append a line of HTML to the console with a newline.
+        Append a line of HTML to the console as its own paragraph block
+        (required for maximumBlockCount trimming to work).
         """
-        cursor = self.console.textCursor()
-        cursor.movePosition(cursor.MoveOperation.End)
-        if self.console.toPlainText():
-            cursor.insertHtml("<br/>" + html)
-        else:
-            cursor.insertHtml(html)
-        self.console.setTextCursor(cursor)
-        self.console.ensureCursorVisible()
+        self.console.append(html)
+        # Scroll by moving the cursor: cheaper than querying the scrollbar
+        # maximum, which forces an extra geometry pass after the insert.
+        self.console.moveCursor(QTextCursor.MoveOperation.End)
 
     def _apply_theme_styles(self, theme: VortexTheme):
         """
         Apply style sheets for the whole window depending on theme.
+        Stylesheet strings are cached per theme after the first build.
+        """
+        css = self._theme_styles.get(theme)
+        if css is None:
+            css = self._build_theme_styles(theme)
+            self._theme_styles[theme] = css
+        self.setStyleSheet(css)
+        self._current_theme = theme
+
+    def _build_theme_styles(self, theme: VortexTheme) -> str:
+        """
+        Build the full stylesheet string for a theme.
         Only uses the 4 allowed colors.
         """
 
@@ -376,4 +436,4 @@ class VortexWindow(QMainWindow):
         else:
             extra = ""
 
-        self.setStyleSheet(base_style + extra)
+        return base_style + extra